@@ -1,70 +1,66 @@
 import os
+from collections import namedtuple
+from types import MappingProxyType
 from modules.camera_utils.config import REDMI_NOTE_11_PRO_MAIN_CAMERA, CANON_EOS_R6_CAMERA, IPHONE_13_PRO_MAX_MAIN_CAMERA
 
-CAMERA = "camera"
-FILE = "file"
-DISTANCE_CM = "distance_cm"
-ELEMENT_HEIGHT_IN_CM = "element_height_in_cm"
-ELEMENT_LENGTH_IN_PX = "element_height_in_px"
-DEGREES = "degrees"
-Y1 = "y1"
+SampleParams = namedtuple('SampleParams', 'file camera distance_cm element_height_cm element_length_px y1 degrees')
 
 IMAGES_PATH = os.path.join(os.path.dirname(__file__), 'resources')
 
-RULER_SAMPLE_IMGS = {
-    'Redmi Note 11 Pro - Main - Vertical': {
-        FILE: "dist-300-meter-150-angle-0-camera-canon-eos-R6.JPG",
-        CAMERA: REDMI_NOTE_11_PRO_MAIN_CAMERA,
-        DISTANCE_CM: 160, # Distance to the element to measure
-        ELEMENT_HEIGHT_IN_CM: 160.0, # Distance
-        ELEMENT_LENGTH_IN_PX: 2873, # Number of pixels
-        Y1: 0,
-        DEGREES: 0 # Angle of the element to measure
-    },
-    'CANON EOS R6 - Pic2World':{
-      FILE: 'Distance-140cm-angle-60-deg-Height-90cm-1969px-CANON-EOS-R6.JPG',
-        CAMERA: CANON_EOS_R6_CAMERA,
-        DISTANCE_CM: 140,
-        ELEMENT_HEIGHT_IN_CM: 90,
-        ELEMENT_LENGTH_IN_PX: 1969,
-        Y1: 0,
-        DEGREES: 60
-    },
-    'Canon EOS R6 - Vertical': {
-        FILE: "dist-300-meter-150-angle-0-camera-canon-eos-R6.JPG",
-        CAMERA: CANON_EOS_R6_CAMERA,
-        DISTANCE_CM: 300.0, # Distance to the element to measure
-        ELEMENT_HEIGHT_IN_CM: 148.0, # Distance
-        ELEMENT_LENGTH_IN_PX: 3178, # Number of pixels
-        Y1: 0,
-        DEGREES: 0 # Angle of the camera with respect to the element
-    },
-    'Canon EOS R6 - Horizontal - 90 deg': {
-        FILE : 'dist-100-large-90-ange-90deg-canon-eos-r6.JPG',
-        CAMERA: CANON_EOS_R6_CAMERA,
-        DISTANCE_CM: 100.0, # Distance to the element to measure
-        ELEMENT_HEIGHT_IN_CM: 90.0, # Distance
-        ELEMENT_LENGTH_IN_PX: 146, # Number of pixels
-        Y1: 1910, # Y1 coordinate of the element
-        DEGREES: 90#89.8 # Angle of the camera with respect to the element
-    },
-    'Canon EOS R6 - Horizontal - 60 deg': {
-        FILE : 'dist-118-large-90-ange-60deg-canon-eos-r6.JPG',
-        CAMERA: CANON_EOS_R6_CAMERA,
-        DISTANCE_CM: 118.0, # Distance to the element to measure
-        ELEMENT_HEIGHT_IN_CM: 90.0, # Distance
-        ELEMENT_LENGTH_IN_PX: 2320, # Number of pixels
-        Y1: 1184,
-        DEGREES: 60 # Angle of the camera with respect to the element
-    },
-    'Iphone 13 Pro Max - Hamburguers - Ham 1 - zenith': {
-        FILE : 'large-11-5-cm - angle-5-.jpeg',
-        CAMERA: IPHONE_13_PRO_MAX_MAIN_CAMERA,
-        DISTANCE_CM: 57, # Distance to the element to measure
-        ELEMENT_HEIGHT_IN_CM: 11.5, # Distance
-        ELEMENT_LENGTH_IN_PX: 315, # More or less
-        Y1: 0,
-        DEGREES: 5 # Angle of the camera with respect to the element
-    },
+RULER_SAMPLE_IMGS = MappingProxyType({
+    'Redmi Note 11 Pro - Main - Vertical': SampleParams(
+        file="dist-300-meter-150-angle-0-camera-canon-eos-R6.JPG",
+        camera=REDMI_NOTE_11_PRO_MAIN_CAMERA,
+        distance_cm=160, # Distance to the element to measure
+        element_height_cm=160.0, # Distance
+        element_length_px=2873, # Number of pixels
+        y1=0,
+        degrees=0 # Angle of the element to measure
+    ),
+    'CANON EOS R6 - Pic2World': SampleParams(
+        file='Distance-140cm-angle-60-deg-Height-90cm-1969px-CANON-EOS-R6.JPG',
+        camera=CANON_EOS_R6_CAMERA,
+        distance_cm=140,
+        element_height_cm=90,
+        element_length_px=1969,
+        y1=0,
+        degrees=60
+    ),
+    'Canon EOS R6 - Vertical': SampleParams(
+        file="dist-300-meter-150-angle-0-camera-canon-eos-R6.JPG",
+        camera=CANON_EOS_R6_CAMERA,
+        distance_cm=300.0, # Distance to the element to measure
+        element_height_cm=148.0, # Distance
+        element_length_px=3178, # Number of pixels
+        y1=0,
+        degrees=0 # Angle of the camera with respect to the element
+    ),
+    'Canon EOS R6 - Horizontal - 90 deg': SampleParams(
+        file='dist-100-large-90-ange-90deg-canon-eos-r6.JPG',
+        camera=CANON_EOS_R6_CAMERA,
+        distance_cm=100.0, # Distance to the element to measure
+        element_height_cm=90.0, # Distance
+        element_length_px=146, # Number of pixels
+        y1=1910, # Y1 coordinate of the element
+        degrees=90#89.8 # Angle of the camera with respect to the element
+    ),
+    'Canon EOS R6 - Horizontal - 60 deg': SampleParams(
+        file='dist-118-large-90-ange-60deg-canon-eos-r6.JPG',
+        camera=CANON_EOS_R6_CAMERA,
+        distance_cm=118.0, # Distance to the element to measure
+        element_height_cm=90.0, # Distance
+        element_length_px=2320, # Number of pixels
+        y1=1184,
+        degrees=60 # Angle of the camera with respect to the element
+    ),
+    'Iphone 13 Pro Max - Hamburguers - Ham 1 - zenith': SampleParams(
+        file='large-11-5-cm - angle-5-.jpeg',
+        camera=IPHONE_13_PRO_MAX_MAIN_CAMERA,
+        distance_cm=57, # Distance to the element to measure
+        element_height_cm=11.5, # Distance
+        element_length_px=315, # More or less
+        y1=0,
+        degrees=5 # Angle of the camera with respect to the element
+    ),
 
-}
\ No newline at end of file
+})
\ No newline at end of file
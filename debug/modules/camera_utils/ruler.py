@@ -1,22 +1,31 @@
+import numpy as np
 from modules.camera_utils.ruler import Ruler
-from debug.constants import RULER_SAMPLE_IMGS, CAMERA,\
-                            DISTANCE_CM, ELEMENT_LENGTH_IN_PX, ELEMENT_HEIGHT_IN_CM, DEGREES, Y1
+from debug.constants import RULER_SAMPLE_IMGS
 
 if __name__ == '__main__':
-    # Get the camera
+    # Group the samples by camera, so that distances can be computed in a single batched call per camera
+    samples_by_camera = {}
     for sample, sample_params in RULER_SAMPLE_IMGS.items():
-        print("For sample: {sample}".format(sample=sample))
-        camera = sample_params[CAMERA]
+        samples_by_camera.setdefault(sample_params.camera, []).append(sample)
+    img_distances = {}
+    for camera, samples in samples_by_camera.items():
         ruler = Ruler(camera = camera)
-        img_distance = ruler.distance_to_object_cm(object_length_px=sample_params[ELEMENT_LENGTH_IN_PX],
-                                                   real_object_length_cm=sample_params[ELEMENT_HEIGHT_IN_CM],
-                                                   angle_degrees=sample_params[DEGREES],
-                                                   object_y1_px=sample_params[Y1])
-        print("\tDistance to object: Calculated: {calc} cm - Real {real} cm".format(calc=img_distance,
-                                                                                  real=sample_params[DISTANCE_CM]))
-        object_height = ruler.object_length_in_cm(object_length_px=sample_params[ELEMENT_LENGTH_IN_PX],
-                                                  distance_to_object_cm=sample_params[DISTANCE_CM],
-                                                  angle_degrees=sample_params[DEGREES],
-                                                  object_y1_px=sample_params[Y1])
+        samples_params = [RULER_SAMPLE_IMGS[sample] for sample in samples]
+        distances = ruler.distance_to_object_cm_batch(
+            object_length_px=np.array([params.element_length_px for params in samples_params]),
+            real_object_length_cm=np.array([params.element_height_cm for params in samples_params]),
+            angle_degrees=np.array([params.degrees for params in samples_params]),
+            object_y1_px=np.array([params.y1 for params in samples_params]))
+        img_distances.update(zip(samples, distances))
+
+    for sample, sample_params in RULER_SAMPLE_IMGS.items():
+        print("For sample: {sample}".format(sample=sample))
+        ruler = Ruler(camera = sample_params.camera)
+        print("\tDistance to object: Calculated: {calc} cm - Real {real} cm".format(calc=img_distances[sample],
+                                                                                  real=sample_params.distance_cm))
+        object_height = ruler.object_length_in_cm(object_length_px=sample_params.element_length_px,
+                                                  distance_to_object_cm=sample_params.distance_cm,
+                                                  angle_degrees=sample_params.degrees,
+                                                  object_y1_px=sample_params.y1)
         print("\tObject height: Calculated: {calc} cm - Real {real} cm".format(calc=object_height,
-                                                                            real=sample_params[ELEMENT_HEIGHT_IN_CM]))
\ No newline at end of file
+                                                                            real=sample_params.element_height_cm))
@@ -1,9 +1,18 @@
-from math import radians, atan, cos
+from math import radians, degrees, atan, cos
 
 class Camera:
     """
     This class implements all the camera parameters
     """
+    __slots__ = ('pixel_size_mm', 'pixel_size_cm', 'pixel_size_m',
+                 'focal_length_mm', 'focal_length_cm', 'focal_length_m',
+                 'inv_focal_length_mm', 'inv_focal_length_cm',
+                 'angle_degrees', 'angle_radians', 'lens_power_diopters',
+                 'sensor_shape_px', 'sensor_shape_mm', 'sensor_shape_cm', 'sensor_shape_m',
+                 'sensor_height_px', 'sensor_half_height_px', 'inv_sensor_height_px',
+                 'sensor_aperture_radians', 'sensor_aperture_degrees', 'sensor_aperture_y_radians',
+                 'cos_of_half_aperture_width')
+
     def __init__(self, pixel_size_mm: float, focal_length_mm: float,
                  sensor_shape_px: tuple[int|float, int|float] | None = None,
                  angle_degrees: float = 0.0):
@@ -19,6 +28,9 @@ class Camera:
         self.focal_length_mm = focal_length_mm
         self.focal_length_cm = focal_length_mm / 10.0
         self.focal_length_m = focal_length_mm / 1000.0
+        # Reciprocals, so that the Ruler can multiply instead of divide
+        self.inv_focal_length_mm = 1.0 / self.focal_length_mm
+        self.inv_focal_length_cm = 1.0 / self.focal_length_cm
 
         self.angle_degrees = angle_degrees
         self.angle_radians = radians(angle_degrees)
@@ -29,15 +41,27 @@ class Camera:
 
         if sensor_shape_px is not None:
             assert len(sensor_shape_px) == 2, "The sensor shape must be a tuple of two integers"
-            self.sensor_shape_mm = tuple(x * self.pixel_size_mm for x in sensor_shape_px)
-            self.sensor_shape_cm = tuple(x/10.0 for x in self.sensor_shape_mm)
-            self.sensor_shape_m = tuple(x/1000.0 for x in self.sensor_shape_mm)
+            # The sensor shape always has two elements, so build the tuples directly
+            sensor_shape_0_mm, sensor_shape_1_mm = sensor_shape_px[0] * pixel_size_mm, sensor_shape_px[1] * pixel_size_mm
+            self.sensor_shape_mm = (sensor_shape_0_mm, sensor_shape_1_mm)
+            self.sensor_shape_cm = (sensor_shape_0_mm / 10.0, sensor_shape_1_mm / 10.0)
+            self.sensor_shape_m = (sensor_shape_0_mm / 1000.0, sensor_shape_1_mm / 1000.0)
+            self.sensor_height_px = sensor_shape_px[0]
+            self.sensor_half_height_px = sensor_shape_px[0] * 0.5
+            self.inv_sensor_height_px = 1.0 / sensor_shape_px[0]
 
-            self.sensor_aperture_radians = tuple(2 * atan(x / (2 * self.focal_length_mm)) for x in self.sensor_shape_mm)
-            self.cos_of_half_aperture_width = tuple(cos(aperture / 2.0) for aperture in self.sensor_aperture_radians)
+            aperture_0_radians = 2 * atan(sensor_shape_0_mm / (2 * focal_length_mm))
+            aperture_1_radians = 2 * atan(sensor_shape_1_mm / (2 * focal_length_mm))
+            self.sensor_aperture_radians = (aperture_0_radians, aperture_1_radians)
+            self.sensor_aperture_degrees = (degrees(aperture_0_radians), degrees(aperture_1_radians))
+            self.cos_of_half_aperture_width = (cos(aperture_0_radians / 2.0), cos(aperture_1_radians / 2.0))
+            self.sensor_aperture_y_radians = aperture_0_radians
         else:
             self.sensor_shape_mm, self.sensor_shape_cm, self.sensor_shape_m = None, None, None
-            self.sensor_aperture_radians, self.cos_of_half_aperture_width = None, None
+            self.sensor_height_px, self.sensor_half_height_px, self.inv_sensor_height_px = None, None, None
+            self.sensor_aperture_radians, self.sensor_aperture_degrees = None, None
+            self.cos_of_half_aperture_width = None
+            self.sensor_aperture_y_radians = None
 
     def px_to_mm(self, px: int | float) -> float:
         """
@@ -49,11 +73,11 @@ class Camera:
         """
         Convert a number of pixels to the physical centimeters occupied in the sensor
         """
-        return self.px_to_mm(px) / 10.0
+        return px * self.pixel_size_cm
 
     def px_to_m(self, px: int | float) -> float:
         """
         Convert a number of pixels to the physical meters occupied in the sensor
         """
-        return self.px_to_mm(px) / 1000.0
+        return px * self.pixel_size_m
 
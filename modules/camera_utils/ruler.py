@@ -11,11 +11,20 @@ from modules.camera_utils.camera import Camera
 import math
 import numpy as np
 
+# Maximum number of perspective correction factors that a Ruler keeps cached
+PERSPECTIVE_CACHE_SIZE = 256
+# Correction factors (1/cos) for the angles far from 90º, where field of view is not considered. Shared by all Rulers,
+# as they only depend on the angle. The integer angles are precomputed, the rest are cached as they are used.
+_INV_COS_TABLE: dict[int, float] = {degrees: 1.0 / math.cos(math.radians(degrees)) for degrees in range(0, 181)}
+_INV_COS_CACHE: dict[int | float, float] = {}
+
 class Ruler:
     """
     This class functions are used to calculate the real-world distances from the image distances
     and the camera parameters. All these calculations are based in the Thin-Lens Equation.
     """
+    __slots__ = ('camera', '_focal_over_pixel_size', '_pixel_size_over_focal', '_sensor_half_height_px',
+                 '_inv_sensor_height_px', '_sensor_aperture_y_radians', '_perspective_cache')
 
     def __init__(self, camera: Camera):
         """
@@ -23,6 +32,17 @@ class Ruler:
         """
         assert isinstance(camera, Camera), "The camera must be a Camera object"
         self.camera = camera
+        # Thin-lens ratios between the focal length and the pixel size, the only camera parameters that the
+        # estimations need once the perspective is corrected
+        self._focal_over_pixel_size = camera.focal_length_cm / camera.pixel_size_cm
+        self._pixel_size_over_focal = camera.pixel_size_cm * camera.inv_focal_length_cm
+        # Sensor terms for the field of view correction, kept here to avoid going through the camera on every call.
+        # They are None when the sensor shape of the camera is unknown
+        self._sensor_half_height_px = camera.sensor_half_height_px
+        self._inv_sensor_height_px = camera.inv_sensor_height_px
+        self._sensor_aperture_y_radians = camera.sensor_aperture_y_radians
+        # Perspective correction factors (1/cos) keyed by (object_degrees, object_y1_px, object_y2_px)
+        self._perspective_cache = {}
 
     def distance_to_object_cm(self, object_length_px: float, real_object_length_cm: float,
                               angle_degrees: int|float|None = 0,
@@ -48,16 +68,16 @@ class Ruler:
         return:
             float: The distance from the camera lens to the object in cm.
         """
-        # Get the pixel size in centimeters
-        if angle_degrees is None:
-            object_measure_in_sensor_cm = self.camera.px_to_cm(px=object_length_px)
-        else:
-            # Correct the perspective
-            object_measure_in_sensor_cm = self.__correct_z_perspective(object_degrees=angle_degrees,
-                                                                       object_y1_px=object_y1_px,
-                                                                       object_y2_px=object_y1_px+object_length_px)
-        magnification = real_object_length_cm / object_measure_in_sensor_cm
-        distance_to_objective = self.camera.focal_length_cm * magnification
+        # Objects seen straight (or at an unknown angle) need no perspective correction, which is the usual case
+        if angle_degrees is None or angle_degrees == 0:
+            return real_object_length_cm * self._focal_over_pixel_size / object_length_px
+        # Get the factor that corrects the perspective of the object length
+        perspective_correction = self.__perspective_correction_factor(object_degrees=angle_degrees,
+                                                                      object_y1_px=object_y1_px,
+                                                                      object_y2_px=object_y1_px+object_length_px)
+        # focal_length * (real_length / length_in_sensor), being length_in_sensor = px * pixel_size * correction
+        distance_to_objective = real_object_length_cm * self._focal_over_pixel_size / \
+                                (object_length_px * perspective_correction)
         return distance_to_objective
 
     def object_length_in_cm(self, distance_to_object_cm: float, object_length_px: float,
@@ -81,51 +101,144 @@ class Ruler:
         return:
             float: The real height of the object in cm.
         """
-        if angle_degrees is None:
-            object_measure_in_sensor_cm = self.camera.px_to_cm(px=object_length_px)
-        else:
-            # Correct the perspective
-            object_measure_in_sensor_cm = self.__correct_z_perspective(object_degrees=angle_degrees,
-                                                                       object_y1_px=object_y1_px,
-                                                                       object_y2_px=object_y1_px+object_length_px)
-        # Calculate the magnification from the distances (real_distance/focal_length)
-        magnification = distance_to_object_cm / self.camera.focal_length_cm
-        real_object_length_cm = object_measure_in_sensor_cm * magnification
+        # Objects seen straight (or at an unknown angle) need no perspective correction, which is the usual case
+        if angle_degrees is None or angle_degrees == 0:
+            return object_length_px * distance_to_object_cm * self._pixel_size_over_focal
+        # Get the factor that corrects the perspective of the object length
+        perspective_correction = self.__perspective_correction_factor(object_degrees=angle_degrees,
+                                                                      object_y1_px=object_y1_px,
+                                                                      object_y2_px=object_y1_px+object_length_px)
+        # length_in_sensor * magnification, being magnification = real_distance/focal_length
+        real_object_length_cm = object_length_px * perspective_correction * distance_to_object_cm * \
+                                self._pixel_size_over_focal
         return real_object_length_cm
 
+    def distance_to_object_cm_batch(self, object_length_px: np.ndarray, real_object_length_cm: np.ndarray | float,
+                                    angle_degrees: np.ndarray | int | float | None = 0,
+                                    object_y1_px: np.ndarray | int | float = 0) -> np.ndarray:
+        """
+        Vectorized version of distance_to_object_cm. Estimates the distance from the camera lens to
+        N objects at once, given the number of pixels they occupy in the image and their real heights.
+        parameters:
+            object_length_px: np.ndarray: The number of pixels that each object occupies in the image. Shape (N,).
+            real_object_length_cm: np.ndarray | float: The real height of each object in cm. Shape (N,) or scalar.
+            angle_degrees: np.ndarray|int|float|None: The angle between the camera and the plain of each object.
+                                                      Shape (N,) or scalar. Use None if the angle is unknown. Default: 0.
+            object_y1_px: np.ndarray|int|float: The y coordinate of the top of each object in the image.
+                                                Shape (N,) or scalar. Default: 0.
+        return:
+            np.ndarray: The distance from the camera lens to each object in cm. Shape (N,). Given as float32.
+        """
+        # Pixel lengths and real-world measures are well within float32 precision
+        object_length_px = np.asarray(object_length_px, dtype=np.float32)
+        real_object_length_cm = np.asarray(real_object_length_cm, dtype=np.float32)
+        if angle_degrees is None:
+            return real_object_length_cm * self._focal_over_pixel_size / object_length_px
+        object_y1_px = np.asarray(object_y1_px, dtype=np.float32)
+        perspective_correction = self.__perspective_correction_factor_batch(object_degrees=angle_degrees,
+                                                                            object_y1_px=object_y1_px,
+                                                                            object_y2_px=object_y1_px+object_length_px)
+        return real_object_length_cm * self._focal_over_pixel_size / (object_length_px * perspective_correction)
+
+    def object_length_in_cm_batch(self, distance_to_object_cm: np.ndarray | float, object_length_px: np.ndarray,
+                                  angle_degrees: np.ndarray | int | float | None = 0,
+                                  object_y1_px: np.ndarray | int | float = 0) -> np.ndarray:
+        """
+        Vectorized version of object_length_in_cm. Estimates the real height of N objects at once,
+        given their distance to the camera lens and the number of pixels they occupy in the image.
+        parameters:
+            distance_to_object_cm: np.ndarray | float: The distance from the camera lens to each object in cm.
+                                                       Shape (N,) or scalar.
+            object_length_px: np.ndarray: The number of pixels that each object occupies in the image. Shape (N,).
+            angle_degrees: np.ndarray|int|float|None: The angle between the camera and the plain of each object.
+                                                      Shape (N,) or scalar. Use None if the angle is unknown. Default: 0.
+            object_y1_px: np.ndarray|int|float: The y coordinate of the top of each object in the image.
+                                                Shape (N,) or scalar. Default: 0.
+        return:
+            np.ndarray: The real height of each object in cm. Shape (N,). Given as float32.
+        """
+        # Pixel lengths and real-world measures are well within float32 precision
+        object_length_px = np.asarray(object_length_px, dtype=np.float32)
+        distance_to_object_cm = np.asarray(distance_to_object_cm, dtype=np.float32)
+        if angle_degrees is None:
+            return object_length_px * distance_to_object_cm * self._pixel_size_over_focal
+        object_y1_px = np.asarray(object_y1_px, dtype=np.float32)
+        perspective_correction = self.__perspective_correction_factor_batch(object_degrees=angle_degrees,
+                                                                            object_y1_px=object_y1_px,
+                                                                            object_y2_px=object_y1_px+object_length_px)
+        return object_length_px * perspective_correction * distance_to_object_cm * self._pixel_size_over_focal
+
 
     # ------------------------------ PRIVATES ---------------------------------
 
-    def __correct_z_perspective(self, object_degrees: float | int, object_y1_px: float | int,
-                                object_y2_px: float | int):
+    def __perspective_correction_factor(self, object_degrees: float | int, object_y1_px: float | int,
+                                        object_y2_px: float | int) -> float:
         """
         Given an object that occupies object_y1_px to object_y2_px pixels in the image,
         when it is with a perspective of object_degrees degrees, by a camera with a given
-        lens aperture, return the object_y1_px to object_y2_px that would correspond if
-        it was seen at 0 degrees.
+        lens aperture, return the factor by which its length must be multiplied to get the
+        length that would correspond if it was seen at 0 degrees.
         """
-        assert object_y1_px <= object_y2_px, "object_y1_px must be smaller than object_y2_px"
-        assert self.camera.sensor_shape_px is not None, "camera.sensor_shape_px must be known to correct perspective"
+        # Objects seen at 0 degrees need no correction
+        if object_degrees == 0:
+            return 1.0
+        if __debug__:
+            assert object_y1_px <= object_y2_px, "object_y1_px must be smaller than object_y2_px"
 
-        object_perspective_radians = math.radians(object_degrees)
-        object_length_px = object_y2_px - object_y1_px
-        # Get the object length in centimeters
-        object_length_cm = self.camera.px_to_cm(px=object_length_px)
-        # Count the amount of pixels over the top half of the camera sensor
-        object_field_of_view = 0.0
-        if abs(90 - object_degrees) < 5:
-            object_field_of_view = self.__calculate_field_of_view_affectation(object_y1_px, object_y2_px)
-        # Get the object length in cm with the perspective corrected
-        object_length_cm_perspective_corrected = object_length_cm / np.cos(
-            object_perspective_radians - object_field_of_view)
-        # Object perspective coming from 33 degrees and sin works
-        return object_length_cm_perspective_corrected
+        # The correction factor only depends on the geometry, so it is reused across calls
+        if abs(90 - object_degrees) < 5 and self._sensor_aperture_y_radians is not None:
+            # Close to 90º the field of view matters, so the factor also depends on the object position.
+            # It can only be considered when the sensor shape of the camera is known
+            cache_key = (object_degrees, object_y1_px, object_y2_px)
+            correction_factor = self._perspective_cache.get(cache_key)
+            if correction_factor is None:
+                # Count the amount of pixels over the top half of the camera sensor
+                object_field_of_view = self.__calculate_field_of_view_affectation(object_y1_px, object_y2_px)
+                correction_factor = 1.0 / math.cos(math.radians(object_degrees) - object_field_of_view)
+                if len(self._perspective_cache) >= PERSPECTIVE_CACHE_SIZE:
+                    self._perspective_cache.clear()
+                self._perspective_cache[cache_key] = correction_factor
+        else:
+            # Float angles with integer values (e.g. 60.0) also hit the table, as they hash as their int
+            correction_factor = _INV_COS_TABLE.get(object_degrees)
+            if correction_factor is None:
+                correction_factor = _INV_COS_CACHE.get(object_degrees)
+                if correction_factor is None:
+                    correction_factor = 1.0 / math.cos(math.radians(object_degrees))
+                    if len(_INV_COS_CACHE) >= PERSPECTIVE_CACHE_SIZE:
+                        _INV_COS_CACHE.clear()
+                    _INV_COS_CACHE[object_degrees] = correction_factor
+        return correction_factor
+
+    def __perspective_correction_factor_batch(self, object_degrees: np.ndarray | float | int,
+                                              object_y1_px: np.ndarray, object_y2_px: np.ndarray) -> np.ndarray:
+        """
+        Vectorized version of __perspective_correction_factor. Returns, for each object, the factor by
+        which its length must be multiplied to get the length that would correspond if it was seen at 0 degrees.
+        """
+        assert np.all(object_y1_px <= object_y2_px), "object_y1_px must be smaller than object_y2_px"
+
+        object_degrees = np.asarray(object_degrees, dtype=np.float64)
+        # Field of view only affects to the objects whose angle is very close to 90º, and can only be
+        # considered when the sensor shape of the camera is known
+        if self._sensor_aperture_y_radians is None:
+            object_field_of_view = 0.0
+        else:
+            sensor_half_height_px = self._sensor_half_height_px
+            percentage_of_sensor = np.abs(np.abs(object_y1_px - sensor_half_height_px) -
+                                          np.abs(object_y2_px - sensor_half_height_px)) * self._inv_sensor_height_px
+            # Multiply by a 0/1 mask rather than branching per object
+            near_90_degrees = np.abs(90 - object_degrees) < 5
+            object_field_of_view = near_90_degrees * (self._sensor_aperture_y_radians * percentage_of_sensor)
+        # The angles are kept in float64, as 1/cos amplifies their rounding errors when approaching 90º
+        return (1.0 / np.cos(np.radians(object_degrees) - object_field_of_view)).astype(np.float32)
 
     def __calculate_field_of_view_affectation(self, object_y1_px: int | float, object_y2_px: int | float):
-        sensor_half_height_px = self.camera.sensor_shape_px[0] / 2
-        top_half_px = min(sensor_half_height_px, object_y2_px) - min(object_y1_px, sensor_half_height_px)
-        bottom_half_px = max(sensor_half_height_px, object_y2_px) - max(object_y1_px, sensor_half_height_px)
-        percentage_of_sensor = abs(top_half_px - bottom_half_px) / self.camera.sensor_shape_px[0]
+        sensor_half_height_px = self._sensor_half_height_px
+        # |top_half_px - bottom_half_px|, where top and bottom are the pixels of the object over and under
+        # the middle of the sensor, reduces to ||y1 - half| - |y2 - half||
+        top_minus_bottom_px = abs(object_y1_px - sensor_half_height_px) - abs(object_y2_px - sensor_half_height_px)
+        percentage_of_sensor = abs(top_minus_bottom_px) * self._inv_sensor_height_px
         # Let's assume that field of view only affects when the angle is very hard
-        object_field_of_view = self.camera.sensor_aperture_radians[0] * percentage_of_sensor
+        object_field_of_view = self._sensor_aperture_y_radians * percentage_of_sensor
         return object_field_of_view
\ No newline at end of file
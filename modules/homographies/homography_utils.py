@@ -1,11 +1,16 @@
 import numpy as np
-from modules.interactive.interactive_plots import draw_polygon_by_clicking
 from modules.geometry.geometry_utils import circumscribed_rectangle, get_polygon_shape, center_polygon, resize_polygon
-from warnings import warn
 from modules.camera_utils.camera import Camera
 import math
 import cv2
-from matplotlib import pyplot as plt
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+_NUMERIC_TYPES = (int, float, np.integer, np.floating)
+_NUMERIC_OR_NONE_TYPES = _NUMERIC_TYPES + (type(None),)
+_FLOAT_TYPES = (float, np.floating)
+_POLYGON_TYPES = (tuple, list, np.ndarray)
 
 def correct_polygon_perspective(img: np.ndarray,
                                 origin_polygon: tuple[tuple[int|float, int|float], tuple[int|float, int|float],
@@ -15,6 +20,9 @@ def correct_polygon_perspective(img: np.ndarray,
                                 angle_degrees: int|float|None = None,
                                 interactive: bool = False,
                                 pad: float = 0.,
+                                reuse_maps: bool = False,
+                                use_cuda: bool = False,
+                                interpolation: int = cv2.INTER_LINEAR,
                                 verbose: bool = False) -> np.ndarray:
     """
     Corrects the perspective of an image to make a given polygon looks like a rectangle.
@@ -33,26 +41,279 @@ def correct_polygon_perspective(img: np.ndarray,
                     can be None. If both Interactive is True and origin_polygon is not None, that origin_polygon
                     will be used as a fallback. Default is False.
         pad: Float between 0. an 0.95 Padding in the output between the polygon and the image border. Default: 0.
+        reuse_maps: Boolean. If True, the remap tables built for this origin_polygon, output_shape, angle_degrees
+                    and pad are cached (see PerspectiveCorrector), so that successive calls with the same
+                    parameters (e.g. the frames of a video) only cost a cv2.remap. Default is False.
+        use_cuda: Boolean. If True, the image is warped on the GPU with cv2.cuda.warpPerspective. It requires
+                    OpenCV to be built with CUDA and a CUDA device, and is worth it for large images. Default is False.
+        interpolation: Integer. The cv2 interpolation flag used for sampling the image. cv2.INTER_NEAREST is faster,
+                    and the right choice for label masks, where values must not be blended. Default: cv2.INTER_LINEAR.
         verbose: Boolean. If True, verbose the process. Default is False.
     Returns:
         Numpy array of shape (out_height, out_width, channels) or (out_height, out_width). The corrected image.
     """
     # Consistency Checks
-    assert type(pad) in {float, np.float16, np.float32, np.float64}, f"pad should be a float. Got {type(pad)}"
+    assert isinstance(pad, _FLOAT_TYPES), f"pad should be a float. Got {type(pad)}"
     assert pad >= 0. and pad <= 0.95, f"Pad must be between 0. and 0.95. Given: {pad}"
-    if type(img) is np.ndarray:
+    if isinstance(img, np.ndarray):
         assert img.ndim == 3 or img.ndim == 2, "Image must be a 2D or 3D array"
     if origin_polygon is not None:
-        assert type(origin_polygon) in {tuple, list, np.ndarray} and all(len(coords) == 2 for coords in origin_polygon) \
-               and len(origin_polygon) == 4, "origin_polygon must have 4 coordinates"
+        assert isinstance(origin_polygon, _POLYGON_TYPES) and np.shape(origin_polygon) == (4, 2), \
+            "origin_polygon must have 4 coordinates"
     else:
         assert interactive, "Interactive mode is required if origin_polygon is not given"
-    assert (type(angle_degrees) in {type(None), int, float, np.float32, np.int32, np.float64, np.int64}), \
+    assert not (use_cuda and reuse_maps), "use_cuda and reuse_maps can not be used together"
+    assert not use_cuda or cv2.cuda.getCudaEnabledDeviceCount() > 0, \
+        "use_cuda requires OpenCV built with CUDA support and a CUDA device"
+    assert isinstance(angle_degrees, _NUMERIC_OR_NONE_TYPES), \
         f"Angle_degrees must be a number or None. Got {type(angle_degrees)}"
 
     # Definition of the polygon
     if interactive:
+        # Imported here, as matplotlib is slow to import and only needed for the interactive mode
+        from modules.interactive.interactive_plots import draw_polygon_by_clicking
         origin_polygon = draw_polygon_by_clicking(img=img, sides=4, fallback_polygon=origin_polygon, verbose=verbose)
+    if reuse_maps:
+        corrector = _cached_perspective_corrector(*_transform_cache_key(origin_polygon=origin_polygon,
+                                                                        output_shape=output_shape,
+                                                                        angle_degrees=angle_degrees, pad=pad),
+                                                  interpolation=interpolation)
+        img = corrector(img=img)
+    else:
+        if verbose:
+            # The process is plotted while computing the transform, so it can not be taken from the cache
+            inverse_H_matrix, output_shape = _compute_perspective_transform(origin_polygon=origin_polygon,
+                                                                            output_shape=output_shape,
+                                                                            angle_degrees=angle_degrees, pad=pad,
+                                                                            verbose=verbose)
+        else:
+            inverse_H_matrix, output_shape = _cached_perspective_transform(*_transform_cache_key(
+                origin_polygon=origin_polygon, output_shape=output_shape, angle_degrees=angle_degrees, pad=pad))
+        img = _warp_perspective(img=img, inverse_H_matrix=inverse_H_matrix, output_shape=output_shape,
+                                interpolation=interpolation, use_cuda=use_cuda)
+    if verbose:
+        from matplotlib import pyplot as plt
+        plt.clf()
+        plt.title("Image after perspective correction")
+        plt.imshow(img)
+        plt.show()
+    return img
+
+def correct_polygon_perspective_batch(imgs: list[np.ndarray] | tuple[np.ndarray, ...],
+                                      origin_polygons: list[np.ndarray | tuple] | tuple[np.ndarray | tuple, ...] |
+                                                       np.ndarray,
+                                      output_shape: tuple[int, int] | list[int, int] | np.ndarray | None = None,
+                                      angle_degrees: int|float|None|list[int|float|None]|tuple[int|float|None, ...] = None,
+                                      pad: float = 0.,
+                                      interpolation: int = cv2.INTER_LINEAR,
+                                      max_workers: int | None = None) -> list[np.ndarray]:
+    """
+    Batched version of correct_polygon_perspective. Corrects the perspective of several images, each one with its own
+    polygon. All the homographies are computed first, and then the images are warped concurrently in a pool of
+    threads (cv2 releases the GIL while warping). While they run, cv2 internal threading is limited to one thread,
+    so that its own parallel loops do not compete with the pool for the same cores.
+    Args:
+        imgs: List of N numpy arrays of shape (height, width, channels) or (height, width). The images to correct.
+        origin_polygons: List of N polygons (or numpy array) of shape (N, 4, 2). The polygon of each image.
+        output_shape: Tuple of shape (width, height) or None. The shape of all the output images.
+                        See correct_polygon_perspective.
+        angle_degrees: Float, Integer, None, or a list with one of them for each image. Angle of the camera with which
+                        the images were taken. Default is None.
+        pad: Float between 0. an 0.95 Padding in the output between the polygon and the image border. Default: 0.
+        interpolation: Integer. The cv2 interpolation flag. See correct_polygon_perspective.
+        max_workers: Integer or None. The maximum number of threads to use. If None, the number of CPUs.
+    Returns:
+        List of N numpy arrays. The corrected images.
+    """
+    assert len(imgs) == len(origin_polygons), f"There must be a polygon for each image. Got {len(imgs)} images " \
+                                               f"and {len(origin_polygons)} polygons"
+    assert all(np.shape(origin_polygon) == (4, 2) for origin_polygon in origin_polygons), \
+        "Every origin_polygon must have 4 coordinates"
+    assert 0. <= pad <= 0.95, f"Pad must be between 0. and 0.95. Given: {pad}"
+    if isinstance(angle_degrees, (list, tuple, np.ndarray)):
+        assert len(angle_degrees) == len(imgs), f"There must be an angle for each image. Got {len(angle_degrees)}"
+    else:
+        angle_degrees = (angle_degrees,) * len(imgs)
+
+    transforms = [_cached_perspective_transform(*_transform_cache_key(origin_polygon=origin_polygon,
+                                                                      output_shape=output_shape,
+                                                                      angle_degrees=angle, pad=pad))
+                  for origin_polygon, angle in zip(origin_polygons, angle_degrees)]
+
+    def warp(img: np.ndarray, transform: tuple[np.ndarray, tuple[int, int]]) -> np.ndarray:
+        inverse_H_matrix, dsize = transform
+        return _warp_perspective(img=img, inverse_H_matrix=inverse_H_matrix, output_shape=dsize,
+                                 interpolation=interpolation)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    cv2_num_threads = cv2.getNumThreads()
+    cv2.setNumThreads(1)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(warp, imgs, transforms))
+    finally:
+        cv2.setNumThreads(cv2_num_threads)
+
+class PerspectiveCorrector:
+    """
+    Corrects the perspective of successive images taken from the same point of view (e.g. the frames of a static
+    camera), to make a given polygon look like a rectangle. It is equivalent to calling correct_polygon_perspective
+    on every image, but the homography and the map of the pixels to sample are only computed once, at construction,
+    so correcting each image is a single cv2.remap.
+    """
+    __slots__ = ('inverse_H_matrix', 'output_shape', 'interpolation', '_map_xy', '_map_interpolation')
+
+    def __init__(self, origin_polygon: tuple[tuple[int|float, int|float], tuple[int|float, int|float],
+                                             tuple[int|float, int|float], tuple[int|float, int|float]] | np.ndarray,
+                 output_shape: tuple[int, int] | list[int, int] | np.ndarray | None = None,
+                 angle_degrees: int|float|None = None,
+                 pad: float = 0.,
+                 interpolation: int = cv2.INTER_LINEAR):
+        """
+        Computes the homography and the remap tables for the given polygon.
+        Args:
+            origin_polygon: Tuple of shape (4, 2). The polygon to use as a reference.
+            output_shape: Tuple of shape (width, height). The shape of the output images. If not given, the output
+                         shape will be the same as the output rectangle. See correct_polygon_perspective.
+            angle_degrees: Float, Integer or None. Angle of the camera with which the images were taken.
+                            If known, it will be used to infer the aspect ratio of the output images. Default is None.
+            pad: Float between 0. an 0.95 Padding in the output between the polygon and the image border. Default: 0.
+            interpolation: Integer. The cv2 interpolation flag. See correct_polygon_perspective.
+        """
+        assert 0. <= pad <= 0.95, f"Pad must be between 0. and 0.95. Given: {pad}"
+        assert np.shape(origin_polygon) == (4, 2), "origin_polygon must have 4 coordinates"
+        self.inverse_H_matrix, self.output_shape = _compute_perspective_transform(origin_polygon=origin_polygon,
+                                                                                  output_shape=output_shape,
+                                                                                  angle_degrees=angle_degrees, pad=pad)
+        self.interpolation = interpolation
+        # For each output pixel, the (x, y) coordinates of the input image that it samples, through the inverse
+        # homography. It is what cv2.warpPerspective would compute (and discard) on every call
+        map_xy = cv2.perspectiveTransform(src=_output_grid(output_shape=self.output_shape), m=self.inverse_H_matrix)
+        # Store them as fixed point maps, which are faster to remap than floating point ones. Nearest neighbour
+        # sampling only needs the rounded coordinates, so it does not need the interpolation table
+        self._map_xy, self._map_interpolation = cv2.convertMaps(map1=map_xy, map2=None, dstmap1type=cv2.CV_16SC2,
+                                                                nninterpolation=interpolation == cv2.INTER_NEAREST)
+
+    def __call__(self, img: np.ndarray) -> np.ndarray:
+        """
+        Corrects the perspective of the given image.
+        Args:
+            img: Numpy array of shape (height, width, channels) or (height, width). The image to correct.
+        Returns:
+            Numpy array of shape (out_height, out_width, channels) or (out_height, out_width). The corrected image.
+        """
+        assert img.ndim == 3 or img.ndim == 2, "Image must be a 2D or 3D array"
+        return cv2.remap(src=img, map1=self._map_xy, map2=self._map_interpolation, interpolation=self.interpolation)
+
+    def correct_batch(self, imgs: list[np.ndarray] | tuple[np.ndarray, ...] | np.ndarray) -> list[np.ndarray]:
+        """
+        Corrects the perspective of several images. Single channel images of the same shape and dtype are stacked,
+        four at a time, as the channels of a single image, so that each cv2.remap corrects four of them at once
+        (cv2 has vectorized paths up to four channels, beyond that it gets slower than remapping them one by one).
+        Args:
+            imgs: List of N numpy arrays of shape (height, width, channels) or (height, width), or a numpy array of
+                  shape (N, height, width). The images to correct.
+        Returns:
+            List of N numpy arrays of shape (out_height, out_width, channels) or (out_height, out_width).
+            The corrected images.
+        """
+        if len(imgs) < 2 or any(img.ndim != 2 or img.shape != imgs[0].shape or img.dtype != imgs[0].dtype
+                                for img in imgs):
+            return [self(img=img) for img in imgs]
+        corrected_imgs = []
+        for i in range(0, len(imgs), 4):
+            # Reshaped, as cv2 drops the channels axis when the last group has a single image
+            corrected_group = self(img=np.stack(imgs[i:i+4], axis=-1)).reshape(self.output_shape[1],
+                                                                                self.output_shape[0], -1)
+            corrected_imgs.extend(np.ascontiguousarray(corrected_group[..., channel])
+                                  for channel in range(corrected_group.shape[-1]))
+        return corrected_imgs
+
+def _transform_cache_key(origin_polygon: tuple[tuple[int|float, int|float], ...] | np.ndarray,
+                         output_shape: tuple[int, int] | list[int, int] | np.ndarray | None,
+                         angle_degrees: int|float|None,
+                         pad: float) -> tuple[tuple[tuple[float, float], ...], tuple[int, int] | None,
+                                              int|float|None, float]:
+    """
+    Converts the parameters of a perspective transform to hashable ones, so that they can be used as the key of the
+    lru_cache decorated functions (_cached_perspective_transform and _cached_perspective_corrector).
+    Args:
+        origin_polygon: Tuple of shape (4, 2). The polygon to use as a reference.
+        output_shape: Tuple of shape (width, height) or None. See correct_polygon_perspective.
+        angle_degrees: Float, Integer or None. Angle of the camera with which the image was taken.
+        pad: Float between 0. an 0.95 Padding in the output between the polygon and the image border.
+    Returns:
+        Tuple of the polygon as a tuple of tuples, the output shape as a tuple of ints (or None), the angle and the pad.
+    """
+    return (tuple(map(tuple, np.asarray(origin_polygon, dtype=np.float32).tolist())),
+            None if output_shape is None else (int(output_shape[0]), int(output_shape[1])),
+            angle_degrees, float(pad))
+
+@lru_cache(maxsize=128)
+def _cached_perspective_transform(origin_polygon: tuple[tuple[float, float], ...],
+                                  output_shape: tuple[int, int] | None,
+                                  angle_degrees: int|float|None,
+                                  pad: float) -> tuple[np.ndarray, tuple[int, int]]:
+    """
+    Computes the inverse homography and the output shape (see _compute_perspective_transform), caching the last ones
+    used, as the same polygon is usually corrected over and over (e.g. on every frame of a static camera). The
+    parameters must be hashable (see _transform_cache_key).
+    Args:
+        origin_polygon: Tuple of shape (4, 2). The polygon to use as a reference.
+        output_shape: Tuple of ints (width, height) or None. See correct_polygon_perspective.
+        angle_degrees: Float, Integer or None. Angle of the camera with which the image was taken.
+        pad: Float between 0. an 0.95 Padding in the output between the polygon and the image border.
+    Returns:
+        Tuple of the inverse homography (read-only numpy array of shape (3, 3)) and the output shape as a
+        (width, height) tuple of ints.
+    """
+    inverse_H_matrix, output_shape = _compute_perspective_transform(origin_polygon=origin_polygon,
+                                                                    output_shape=output_shape,
+                                                                    angle_degrees=angle_degrees, pad=pad)
+    # It is shared by all the calls with the same parameters, so it must not be modified
+    inverse_H_matrix.setflags(write=False)
+    return inverse_H_matrix, output_shape
+
+@lru_cache(maxsize=8)
+def _cached_perspective_corrector(origin_polygon: tuple[tuple[float, float], ...],
+                                  output_shape: tuple[int, int] | None,
+                                  angle_degrees: int|float|None,
+                                  pad: float,
+                                  interpolation: int) -> PerspectiveCorrector:
+    """
+    Builds the PerspectiveCorrector for the given parameters, caching the last ones used. All the parameters must be
+    hashable (see _transform_cache_key).
+    Args:
+        origin_polygon: Tuple of shape (4, 2). The polygon to use as a reference.
+        output_shape: Tuple of ints (width, height) or None. See correct_polygon_perspective.
+        angle_degrees: Float, Integer or None. Angle of the camera with which the image was taken.
+        pad: Float between 0. an 0.95 Padding in the output between the polygon and the image border.
+        interpolation: Integer. The cv2 interpolation flag.
+    Returns:
+        PerspectiveCorrector. The corrector for the given parameters.
+    """
+    return PerspectiveCorrector(origin_polygon=origin_polygon, output_shape=output_shape,
+                                angle_degrees=angle_degrees, pad=pad, interpolation=interpolation)
+
+def _compute_perspective_transform(origin_polygon: tuple[tuple[int|float, int|float], ...] | np.ndarray,
+                                   output_shape: tuple[int, int] | list[int, int] | np.ndarray | None = None,
+                                   angle_degrees: int|float|None = None,
+                                   pad: float = 0.,
+                                   verbose: bool = False) -> tuple[np.ndarray, tuple[int, int]]:
+    """
+    Computes the inverse homography, the one that transforms the output rectangle into origin_polygon, and the shape
+    of the output. The inverse is what warping needs, as it tells, for each output pixel, the input pixel to sample.
+    Args:
+        origin_polygon: Tuple of shape (4, 2). The polygon to use as a reference.
+        output_shape: Tuple of shape (width, height) or None. See correct_polygon_perspective.
+        angle_degrees: Float, Integer or None. Angle of the camera with which the image was taken.
+        pad: Float between 0. an 0.95 Padding in the output between the polygon and the image border. Default: 0.
+        verbose: Boolean. If True, verbose the process. Default is False.
+    Returns:
+        Tuple of the inverse homography (numpy array of shape (3, 3)) and the output shape as a (width, height)
+        tuple of ints.
+    """
     # Compute the output polygon
     output_polygon = __compute_output_polygon(origin_polygon=origin_polygon, angle_degrees=angle_degrees,
                                               verbose=verbose)
@@ -62,16 +323,57 @@ def correct_polygon_perspective(img: np.ndarray,
     else:
         # Place the output polygon in the center of the image
         output_polygon = center_polygon(polygon=output_polygon, output_shape=output_shape, resize_pad=pad)
-    # Transform it to a numpy array
-    origin_polygon, output_polygon = np.array(origin_polygon, dtype=np.float32), np.array(output_polygon, dtype=np.float32)
-    H_matrix = cv2.getPerspectiveTransform(src=origin_polygon, dst=output_polygon)
-    img = cv2.warpPerspective(src=img, M=H_matrix, dsize=output_shape, flags=cv2.INTER_LINEAR)
-    if verbose:
-        plt.clf()
-        plt.title("Image after perspective correction")
-        plt.imshow(img)
-        plt.show()
-    return img
+    # Transform them to the contiguous float32 arrays that cv2 works with (no copy if they already are)
+    origin_polygon = np.ascontiguousarray(origin_polygon, dtype=np.float32)
+    output_polygon = np.ascontiguousarray(output_polygon, dtype=np.float32)
+    # Computing the homography from the output to the origin avoids having to invert it later
+    inverse_H_matrix = cv2.getPerspectiveTransform(src=output_polygon, dst=origin_polygon)
+    return inverse_H_matrix, (int(output_shape[0]), int(output_shape[1]))
+
+@lru_cache(maxsize=8)
+def _output_grid(output_shape: tuple[int, int]) -> np.ndarray:
+    """
+    Builds the (x, y) coordinates of every pixel of an output image. The output shape is usually constant across a
+    run, so grids are cached and shared (as read-only arrays) by all the PerspectiveCorrectors with the same shape.
+    Args:
+        output_shape: Tuple of ints (width, height). The shape of the output image.
+    Returns:
+        Read-only numpy array of shape (height, width, 2) and dtype float32. The coordinates of each pixel.
+    """
+    width, height = output_shape
+    output_grid = np.stack(np.meshgrid(np.arange(width, dtype=np.float32), np.arange(height, dtype=np.float32)),
+                           axis=-1)
+    output_grid.setflags(write=False)
+    return output_grid
+
+def _warp_perspective(img: np.ndarray, inverse_H_matrix: np.ndarray, output_shape: tuple[int, int],
+                      interpolation: int = cv2.INTER_LINEAR, use_cuda: bool = False) -> np.ndarray:
+    """
+    Warps img with the inverse homography given by _compute_perspective_transform. When the homography is just an
+    integer translation whose window lies inside the image (e.g. an axis-aligned polygon with integer corners, without
+    angle_degrees nor output_shape), the warp would only copy pixels, so the window is cropped instead.
+    Args:
+        img: Numpy array of shape (height, width, channels) or (height, width). The image to warp.
+        inverse_H_matrix: Numpy array of shape (3, 3). The homography from the output to the origin.
+        output_shape: Tuple of ints (width, height). The shape of the output image.
+        interpolation: Integer. The cv2 interpolation flag. Default: cv2.INTER_LINEAR.
+        use_cuda: Boolean. If True, warp the image on the GPU. Default is False.
+    Returns:
+        Numpy array. The warped image.
+    """
+    width, height = output_shape
+    x1, y1 = round(inverse_H_matrix[0, 2]), round(inverse_H_matrix[1, 2])
+    if np.allclose(inverse_H_matrix, ((1., 0., x1), (0., 1., y1), (0., 0., 1.)), rtol=0., atol=1e-6) and \
+            0 <= x1 and x1 + width <= img.shape[1] and 0 <= y1 and y1 + height <= img.shape[0]:
+        return img[y1:y1+height, x1:x1+width].copy()
+    # The homography is already given from the output to the origin, so cv2 does not need to invert it
+    if use_cuda:
+        gpu_img = cv2.cuda_GpuMat()
+        gpu_img.upload(img)
+        return cv2.cuda.warpPerspective(gpu_img, inverse_H_matrix, output_shape,
+                                        flags=interpolation | cv2.WARP_INVERSE_MAP).download()
+    return cv2.warpPerspective(src=img, M=inverse_H_matrix, dsize=output_shape,
+                               flags=interpolation | cv2.WARP_INVERSE_MAP)
 
 def __compute_output_polygon(origin_polygon: tuple[tuple[int|float, int|float], tuple[int|float, int|float],
                                                 tuple[int|float, int|float], tuple[int|float, int|float]] | np.ndarray,
@@ -92,34 +394,32 @@ def __compute_output_polygon(origin_polygon: tuple[tuple[int|float, int|float],
     Returns:
         Tuple of shape (4, 2). The output polygon coordinates in the form ((x1, y1), (x2, y2), (x3, y3), (x4, y4)).
     """
-    assert type(origin_polygon) in {tuple, list, np.ndarray} and all(len(coords) == 2 for coords in origin_polygon),\
+    assert isinstance(origin_polygon, _POLYGON_TYPES) and np.ndim(origin_polygon) == 2 and \
+           np.shape(origin_polygon)[1] == 2,\
         f"origin_polygon must have 4 coordinates. Input was {origin_polygon}"
-    assert type(angle_degrees) in {type(None), int, float, np.float32, np.int32, np.float64, np.int64}, \
+    assert isinstance(angle_degrees, _NUMERIC_OR_NONE_TYPES), \
         f"Angle_degrees must be a number or None. Got {type(angle_degrees)}"
-    assert type(camera) in {type(None), Camera}, f"camera must be a Camera object. Got {type(camera)}"
-    assert type(verbose) is bool, f"verbose must be a boolean. Got {type(verbose)}"
-    assert type(start_at_0_coord) is bool, f"start_at_0_coord must be a boolean. Got {type(start_at_0_coord)}"
+    assert camera is None or isinstance(camera, Camera), f"camera must be a Camera object. Got {type(camera)}"
+    assert isinstance(verbose, bool), f"verbose must be a boolean. Got {type(verbose)}"
+    assert isinstance(start_at_0_coord, bool), f"start_at_0_coord must be a boolean. Got {type(start_at_0_coord)}"
 
     # If angle is not given, assume that it is not relevant, so just output a rectangle circumscribing the polygon
     if angle_degrees is not None:
-        if type(angle_degrees) in {int, float, np.int32, np.float32, np.int64, np.float64}:
+        if isinstance(angle_degrees, _NUMERIC_TYPES):
             angle_degrees = (None, angle_degrees)
-        elif type(angle_degrees) in {tuple, list, np.ndarray}:
+        elif isinstance(angle_degrees, (tuple, list, np.ndarray)):
             assert len(angle_degrees) == 2, "angle_degrees must have 2 elements"
-            assert type(angle_degrees[0]) in {type(None), int, float, np.int32, np.float32, np.int64, np.float64}, \
+            assert isinstance(angle_degrees[0], _NUMERIC_OR_NONE_TYPES), \
                 f"angle_degrees[0] must be a number or None. Got {type(angle_degrees[0])}"
         else:
             raise ValueError(f"angle_degrees must be a number or None or a tuple of shape (2). Got {type(angle_degrees)}")
 
-        output_size = []
-        for i, angle in enumerate(angle_degrees):
-            if angle is None:
-                output_size.append(None)
-            else:
-                object_perspective_radians = math.radians(angle)
-                object_px_shape = get_polygon_shape(polygon=origin_polygon, as_int=True)[i]
-                object_height_px_perspective_corrected = object_px_shape / np.cos(object_perspective_radians)
-                output_size.append(object_height_px_perspective_corrected)
-        origin_polygon = resize_polygon(polygon=origin_polygon, new_size=tuple(output_size))
+        # The shape is the same for both axes, so compute it only once
+        width_px, height_px = get_polygon_shape(polygon=origin_polygon, as_int=True).tolist()
+        width_angle, height_angle = angle_degrees
+        # Correct the perspective of each axis with a known angle (None leaves that axis untouched)
+        output_width = None if width_angle is None else width_px / math.cos(math.radians(width_angle))
+        output_height = None if height_angle is None else height_px / math.cos(math.radians(height_angle))
+        origin_polygon = resize_polygon(polygon=origin_polygon, new_size=(output_width, output_height))
     # Calculate the circumscribed rectangle
     return circumscribed_rectangle(polygon=origin_polygon, shift_to_coord=0. if start_at_0_coord else None)
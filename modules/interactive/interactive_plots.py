@@ -14,6 +14,8 @@ from matplotlib import pyplot as plt
 from matplotlib.backend_bases import MouseButton
 from warnings import warn
 
+_INTEGER_TYPES = (int, np.integer)
+
 def draw_polygon_by_clicking(img: np.ndarray, sides: int=4, fallback_polygon: np.ndarray | list | tuple |None = None,
                              as_numpy: bool = True, verbose:bool=False) -> np.ndarray:
     """
@@ -28,7 +30,7 @@ def draw_polygon_by_clicking(img: np.ndarray, sides: int=4, fallback_polygon: np
         Numpy array of shape (sides, 2). The polygon in format ((x1, y1), (x2, y2), ...).
     """
     assert img.ndim == 3 or img.ndim == 2, "Image must be a 2D or 3D array"
-    assert type(sides) in {int, np.int32, np.int64}, "The number of sides must be at least 2"
+    assert isinstance(sides, _INTEGER_TYPES), "The number of sides must be at least 2"
     assert fallback_polygon is None or len(fallback_polygon) == sides, "The fallback polygon must have the same number of sides than requested"
     if verbose:
         print("Click on the corners of the polygon")
@@ -36,30 +38,31 @@ def draw_polygon_by_clicking(img: np.ndarray, sides: int=4, fallback_polygon: np
     plt.clf()
     plt.imshow(img)
     title = "Click on the {sides} corners. (Right-Click to remove)".format(sides=sides)
-    plt.title(title)
-    # Get the corners of the polygon by clicking
-    polygon = plt.ginput(n=sides, timeout=0, show_clicks=True, mouse_add=MouseButton.LEFT, mouse_pop=MouseButton.RIGHT)
-    polygon = np.abs(polygon, dtype=np.float32)
-    polygon = order_2d_corners_clockwise(corners=polygon)
-    # Draw the polygon
-    plt.plot(np.append(polygon[:, 0], polygon[:1, 0], axis=0),
-             np.append(polygon[:, 1], polygon[:1, 1], axis=0), 'r-')
-    # show an "is that correct?" window with yes and no buttons
-    is_correct = yes_no_message_in_plt()
-    # If the answer is yes, return the polygon
-    if is_correct:
-        return polygon if as_numpy else polygon.tolist()
-    # If the answer is no, redraw the polygon
-    else:
+    # Ask for the polygon until the user accepts it or cancels
+    while True:
+        plt.title(title)
+        # Get the corners of the polygon by clicking
+        polygon = plt.ginput(n=sides, timeout=0, show_clicks=True, mouse_add=MouseButton.LEFT, mouse_pop=MouseButton.RIGHT)
+        polygon = np.abs(np.asarray(polygon, dtype=np.float32))
+        polygon = order_2d_corners_clockwise(corners=polygon)
+        # Draw the polygon, closing it by repeating the first corner at the end
+        closed_polygon = np.concatenate((polygon, polygon[:1]), axis=0)
+        polygon_line, = plt.plot(closed_polygon[:, 0], closed_polygon[:, 1], 'r-')
+        # show an "is that correct?" window with yes and no buttons
+        is_correct = yes_no_message_in_plt()
+        # If the answer is yes, return the polygon
+        if is_correct:
+            return polygon if as_numpy else polygon.tolist()
+        # If the answer is no, ask whether to set the points again, removing the rejected polygon from the image
         repeat = yes_no_message_in_plt(msg="Set the points again?", yes="Repeat", no="Cancel", yes_color="yellow")
-        if repeat:
-            return draw_polygon_by_clicking(img=img, sides=sides, fallback_polygon=fallback_polygon, verbose=verbose)
-        else:
-            if fallback_polygon is not None:
-                warn("Polygon definition aborted. None is returned", category=UserWarning)
-            else:
-                warn("Polygon definition aborted, using fallback polygon", category=UserWarning)
-            return fallback_polygon
+        polygon_line.remove()
+        if not repeat:
+            break
+    if fallback_polygon is None:
+        warn("Polygon definition aborted. None is returned", category=UserWarning)
+    else:
+        warn("Polygon definition aborted, using fallback polygon", category=UserWarning)
+    return fallback_polygon
 
 def yes_no_message_in_plt(msg: str = "Is that correct?", yes: str = "Yes", no: str = "No",
                           yes_color: str = "green", no_color = "red") -> bool: